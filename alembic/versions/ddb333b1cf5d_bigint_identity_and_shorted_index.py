@@ -0,0 +1,53 @@
+"""bigint identity id and shorted_url index
+
+Revision ID: ddb333b1cf5d
+Revises: 78a8ce692e38
+Create Date: 2026-10-15 18:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ddb333b1cf5d'
+down_revision: Union[str, Sequence[str], None] = '78a8ce692e38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f('ix_url_shorters_original_url'), table_name='url_shorters')
+
+    # serial -> identity: drop the sequence default, then let Postgres own a new
+    # identity sequence that continues after the existing ids.
+    op.alter_column('url_shorters', 'id', type_=sa.BigInteger(), existing_type=sa.Integer(),
+                    existing_nullable=False)
+    op.execute("ALTER TABLE url_shorters ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP SEQUENCE IF EXISTS url_shorters_id_seq")
+    op.execute("ALTER TABLE url_shorters ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    op.execute(
+        "SELECT setval(pg_get_serial_sequence('url_shorters', 'id'), "
+        "COALESCE(MAX(id), 0) + 1, false) FROM url_shorters"
+    )
+
+    op.create_index('ix_url_shorters_shorted', 'url_shorters', ['shorted_url'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_url_shorters_shorted', table_name='url_shorters')
+
+    op.execute("ALTER TABLE url_shorters ALTER COLUMN id DROP IDENTITY IF EXISTS")
+    op.alter_column('url_shorters', 'id', type_=sa.Integer(), existing_type=sa.BigInteger(),
+                    existing_nullable=False)
+    op.execute("CREATE SEQUENCE url_shorters_id_seq OWNED BY url_shorters.id")
+    op.execute(
+        "SELECT setval('url_shorters_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM url_shorters"
+    )
+    op.execute("ALTER TABLE url_shorters ALTER COLUMN id SET DEFAULT nextval('url_shorters_id_seq')")
+
+    op.create_index(op.f('ix_url_shorters_original_url'), 'url_shorters', ['original_url'], unique=False)
@@ -0,0 +1,30 @@
+"""covering unique index on shorted_url
+
+Revision ID: e2fb20a93c13
+Revises: ddb333b1cf5d
+Create Date: 2026-10-15 18:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2fb20a93c13'
+down_revision: Union[str, Sequence[str], None] = 'ddb333b1cf5d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ux_shorted_url', 'url_shorters', ['shorted_url'], unique=True,
+                    postgresql_include=['original_url'])
+    op.drop_index('ix_url_shorters_shorted', table_name='url_shorters')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_url_shorters_shorted', 'url_shorters', ['shorted_url'], unique=True)
+    op.drop_index('ux_shorted_url', table_name='url_shorters')
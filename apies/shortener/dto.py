@@ -1,12 +1,27 @@
-from pydantic import BaseModel, HttpUrl
+import re
+
+from pydantic import BaseModel, Field, field_validator
 
 __all__ = [
     'URLInputDto',
     'URLResponseDto'
 ]
 
+# Scheme, non-empty host, then an optional path/query/fragment with no whitespace.
+# The host class and the tail's leading [/?#] are disjoint, so a failing match
+# cannot be re-split between them and backtracking stays linear.
+_URL_RE = re.compile(r'https?://[^\s/?#]+(?:[/?#]\S*)?', re.IGNORECASE)
+
+
 class URLInputDto(BaseModel):
-    url: HttpUrl  
+    url: str = Field(max_length=2048)
+
+    @field_validator('url')
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        if not _URL_RE.fullmatch(v):
+            raise ValueError("URL must be an absolute http(s) URL")
+        return v
 
 
 class URLResponseDto(BaseModel):
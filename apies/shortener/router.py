@@ -1,17 +1,25 @@
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, Response
 from apies.shortener.dto import URLInputDto, URLResponseDto
 from services.url_shortener.url_shorterner_service import UrlShortenerService
 from utils.get_services import get_url_shortener_service
 
 generator_router = APIRouter(prefix="/api")
 
-@generator_router.post("/generator", response_model=URLResponseDto)
+# Handlers return responses directly so FastAPI skips response-model validation
+# and jsonable_encoder; URLResponseDto is only used to document the schema
+@generator_router.post("/generator", responses={200: {"model": URLResponseDto}})
 async def generate_shorten_link(url: URLInputDto, service: UrlShortenerService = Depends(get_url_shortener_service)):
-    generated_id = service.generate_url_shortener(str(url.url))
-    return URLResponseDto(url=generated_id)
+    generated_id = await service.generate_url_shortener(url.url)
+    return ORJSONResponse({"url": generated_id})
 
 
-@generator_router.get("/generator/{shorted_url}", response_model=URLResponseDto)
+@generator_router.get("/generator/{shorted_url}", responses={200: {"model": URLResponseDto}})
 async def generate_shorten_link(shorted_url: str, service: UrlShortenerService = Depends(get_url_shortener_service)):
-    url_shorterner = service.get_real_link(shorted_url)
-    return URLResponseDto(url=url_shorterner.original_url)
+    # The service hands back the already-rendered body (cached in Redis as bytes)
+    body = await service.get_real_link_body(shorted_url)
+    if body is None:
+        # Returned rather than raised: an HTTPException would unwind through the session
+        # dependency and be logged as a session error for every unknown code
+        return ORJSONResponse({"detail": "Shortened URL not found"}, status_code=404)
+    return Response(content=body, media_type="application/json")
@@ -1,3 +1,3 @@
 from infrastructure.initializer import Initilizer
-from infrastructure.databases.postgres import DatabaseBackend, DatabaseConfig, DatabaseConnector, create_database_connector
-from infrastructure.cache.redis import RedisConfig, RedisMode, SerializationFormat, RedisSerializer, RedisConnector
+from infrastructure.databases.postgres import DatabaseBackend, DatabaseConfig, DatabaseRuntimeConfig, DatabaseConnector, create_database_connector
+from infrastructure.cache.redis import RedisConfig, RedisRuntimeConfig, RedisMode, SerializationFormat, RedisSerializer, RedisConnector
@@ -1,15 +1,24 @@
-import json
 import logging
 import pickle
+import socket
+import threading
 from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, fields
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional,  Set, Type,  TypeVar
 
+import msgpack
+import orjson
 import redis
 import redis.asyncio as aioredis
+import zstandard as zstd
 from pydantic import Field, field_validator
+from redis._parsers import _AsyncHiredisParser, _HiredisParser
 from redis.connection import ConnectionPool
 from redis.sentinel import Sentinel
+# redis-py's own check: also False when the installed hiredis is too old for it to use
+from redis.utils import HIREDIS_AVAILABLE
 from redis.exceptions import ConnectionError, TimeoutError
 from pydantic_settings import BaseSettings
 
@@ -18,6 +27,30 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Compressed values are stored as bare zstd frames and recognised by the frame magic,
+# so uncompressed values (including ones written before compression was enabled) pass through as-is.
+# BYTES values are never compressed nor inspected: they are stored and returned verbatim.
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+_ZSTD_LEVEL = 3
+
+# Protocol 5 (PEP 574) is smaller and faster than the default protocol 4
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Returns the current value if the key exists, otherwise stores ARGV[1]
+# (with ARGV[2] as EX seconds when non-empty) and returns nil
+SET_IF_ABSENT_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    return current
+end
+if ARGV[2] ~= '' then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return false
+"""
+
 
 class RedisMode(str, Enum):
     """Redis deployment modes"""
@@ -29,8 +62,20 @@ class RedisMode(str, Enum):
 class SerializationFormat(str, Enum):
     """Serialization formats for Redis values"""
     JSON = "json"
+    ORJSON = "orjson"
+    MSGPACK = "msgpack"
     PICKLE = "pickle"
     STRING = "string"
+    BYTES = "bytes"
+
+
+def _default_keepalive_options() -> Dict[int, int]:
+    """Detect dead peers within ~90s instead of the kernel's 2h default"""
+    options = {}
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+        if hasattr(socket, name):
+            options[getattr(socket, name)] = value
+    return options
 
 
 class RedisConfig(BaseSettings):
@@ -54,7 +99,7 @@ class RedisConfig(BaseSettings):
     socket_timeout: float = Field(default=5.0, ge=0.1, description="Socket timeout in seconds")
     socket_connect_timeout: float = Field(default=5.0, ge=0.1, description="Connect timeout in seconds")
     socket_keepalive: bool = Field(default=True, description="Enable TCP keepalive")
-    socket_keepalive_options: Dict[str, int] = Field(default_factory=dict)
+    socket_keepalive_options: Dict[int, int] = Field(default_factory=_default_keepalive_options)
     
     # SSL settings
     ssl: bool = Field(default=False, description="Enable SSL/TLS")
@@ -73,8 +118,12 @@ class RedisConfig(BaseSettings):
     cluster_nodes: List[str] = Field(default_factory=list, description="Cluster node host:port list")
     
     # Serialization
-    default_serialization: SerializationFormat = SerializationFormat.JSON
+    default_serialization: SerializationFormat = SerializationFormat.ORJSON
     compress_data: bool = Field(default=False, description="Compress data before storing")
+    compress_min_size: int = Field(default=512, ge=0, description="Minimum payload size in bytes to compress")
+    
+    # KEYS walks the whole keyspace and blocks the server; scan_iter is the safe default
+    allow_keys: bool = Field(default=False, description="Allow the blocking KEYS command")
     
     # Default expiration
     default_ttl: Optional[int] = Field(default=None, ge=1, description="Default TTL in seconds")
@@ -87,7 +136,7 @@ class RedisConfig(BaseSettings):
         case_sensitive = False
         env_file = ".env"
     
-    @property
+    @cached_property
     def connection_kwargs(self) -> Dict[str, Any]:
         """Get connection parameters for Redis client"""
         kwargs = {
@@ -117,28 +166,124 @@ class RedisConfig(BaseSettings):
         return {k: v for k, v in kwargs.items() if v is not None}
 
 
+@dataclass(slots=True, frozen=True)
+class RedisRuntimeConfig:
+    """Frozen snapshot of a validated RedisConfig, read on every cache operation"""
+    
+    mode: RedisMode
+    host: str
+    port: int
+    username: Optional[str]
+    password: Optional[str]
+    db: int
+    max_connections: int
+    retry_on_timeout: bool
+    retry_on_error: List[Type[Exception]]
+    health_check_interval: int
+    socket_timeout: float
+    socket_connect_timeout: float
+    socket_keepalive: bool
+    socket_keepalive_options: Dict[int, int]
+    ssl: bool
+    ssl_cert_reqs: Optional[str]
+    ssl_ca_certs: Optional[str]
+    ssl_certfile: Optional[str]
+    ssl_keyfile: Optional[str]
+    ssl_check_hostname: bool
+    sentinel_hosts: List[str]
+    sentinel_service_name: str
+    sentinel_password: Optional[str]
+    cluster_nodes: List[str]
+    default_serialization: SerializationFormat
+    compress_data: bool
+    compress_min_size: int
+    allow_keys: bool
+    default_ttl: Optional[int]
+    redis_url: Optional[str]
+    # Built once from the settings; slotted dataclasses cannot hold a cached_property
+    connection_kwargs: Dict[str, Any]
+    
+    @classmethod
+    def from_settings(cls, config: RedisConfig) -> "RedisRuntimeConfig":
+        return cls(**{f.name: getattr(config, f.name) for f in fields(cls)})
+
+
 class RedisSerializer:
     
+    def __init__(self, compress: bool = False, compress_min_size: int = 512):
+        self.compress = compress
+        self.compress_min_size = compress_min_size
+        # zstd contexts are not safe to share between threads
+        self._zstd = threading.local()
+    
+    def serialize(self, data: Any, format: SerializationFormat) -> bytes:
+        payload = self._encode(data, format)
+        if not self.compress or format == SerializationFormat.BYTES:
+            return payload
+        if len(payload) >= self.compress_min_size:
+            return self._compressor().compress(payload)
+        return payload
+    
+    def deserialize(self, data: bytes, format: SerializationFormat) -> Any:
+        if self.compress and format != SerializationFormat.BYTES and data.startswith(_ZSTD_MAGIC):
+            data = self._decompressor().decompress(data)
+        return self._decode(data, format)
+    
+    def _compressor(self) -> zstd.ZstdCompressor:
+        compressor = getattr(self._zstd, 'compressor', None)
+        if compressor is None:
+            compressor = self._zstd.compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL)
+        return compressor
+    
+    def _decompressor(self) -> zstd.ZstdDecompressor:
+        decompressor = getattr(self._zstd, 'decompressor', None)
+        if decompressor is None:
+            decompressor = self._zstd.decompressor = zstd.ZstdDecompressor()
+        return decompressor
+    
     @staticmethod
-    def serialize(data: Any, format: SerializationFormat) -> bytes:
+    def _encode(data: Any, format: SerializationFormat) -> bytes:
         if format == SerializationFormat.STRING:
-            if isinstance(data, (str, int, float, bool)):
-                return str(data).encode('utf-8')
+            if isinstance(data, bytes):
+                return data
+            elif isinstance(data, str):
+                return data.encode('utf-8')
+            elif isinstance(data, bool):
+                return b'True' if data else b'False'
+            elif isinstance(data, int):
+                return b'%d' % data
+            elif isinstance(data, float):
+                return repr(data).encode('ascii')
             else:
                 raise ValueError("String format only supports primitive types")
-        elif format == SerializationFormat.JSON:
-            return json.dumps(data, default=str).encode('utf-8')
+        elif format == SerializationFormat.BYTES:
+            if isinstance(data, (bytes, memoryview)):
+                return data
+            elif isinstance(data, bytearray):
+                return bytes(data)
+            else:
+                raise ValueError("Bytes format only supports bytes-like values")
+        elif format in (SerializationFormat.ORJSON, SerializationFormat.JSON):
+            # orjson emits bytes directly and its output is plain JSON, so values
+            # written by the old stdlib encoder stay readable
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        elif format == SerializationFormat.MSGPACK:
+            return msgpack.packb(data, use_bin_type=True, default=str)
         elif format == SerializationFormat.PICKLE:
-            return pickle.dumps(data)
+            return pickle.dumps(data, protocol=_PICKLE_PROTOCOL)
         else:
             raise ValueError(f"Unsupported serialization format: {format}")
     
     @staticmethod
-    def deserialize(data: bytes, format: SerializationFormat) -> Any:
+    def _decode(data: bytes, format: SerializationFormat) -> Any:
         if format == SerializationFormat.STRING:
             return data.decode('utf-8')
-        elif format == SerializationFormat.JSON:
-            return json.loads(data.decode('utf-8'))
+        elif format == SerializationFormat.BYTES:
+            return data
+        elif format in (SerializationFormat.ORJSON, SerializationFormat.JSON):
+            return orjson.loads(data)
+        elif format == SerializationFormat.MSGPACK:
+            return msgpack.unpackb(data, raw=False, strict_map_key=False)
         elif format == SerializationFormat.PICKLE:
             return pickle.loads(data)
         else:
@@ -148,23 +293,42 @@ class RedisSerializer:
 class RedisConnector:
     
     def __init__(self, config: RedisConfig):
-        self.config = config
+        self.config = RedisRuntimeConfig.from_settings(config)
         self._sync_client: Optional[redis.Redis] = None
         self._async_client: Optional[aioredis.Redis] = None
         self._connection_pool: Optional[ConnectionPool] = None
         self._async_connection_pool: Optional[aioredis.ConnectionPool] = None
         self._sentinel: Optional[Sentinel] = None
-        self.serializer = RedisSerializer()
+        self._set_if_absent_script = None
+        self._set_if_absent_script_async = None
+        self.serializer = RedisSerializer(self.config.compress_data, self.config.compress_min_size)
+        
+        # Snapshot hot-path lookups once instead of resolving them on every call
+        self._default_format = self.config.default_serialization
+        self._default_ttl = self.config.default_ttl
+        self._serialize = self.serializer.serialize
+        self._deserialize = self.serializer.deserialize
+        
+        if HIREDIS_AVAILABLE:
+            logger.info("hiredis available, using C response parser")
+        else:
+            logger.warning("hiredis not installed or too old for redis-py, falling back to pure-Python response parser")
         
         self._setup_sync_client()
         self._setup_async_client()
     
+    @staticmethod
+    def _parser_kwargs(parser_class: type) -> Dict[str, Any]:
+        """Pin the hiredis parser explicitly when the C extension is installed"""
+        return {'parser_class': parser_class} if HIREDIS_AVAILABLE else {}
+    
     def _setup_sync_client(self):
         try:
             if self.config.redis_url:
                 self._sync_client = redis.from_url(
                     self.config.redis_url,
                     max_connections=self.config.max_connections,
+                    **self._parser_kwargs(_HiredisParser),
                     **self.config.connection_kwargs
                 )
             elif self.config.mode == RedisMode.SENTINEL:
@@ -179,6 +343,7 @@ class RedisConnector:
                 self._sentinel = Sentinel(
                     sentinels,
                     sentinel_kwargs={'password': self.config.sentinel_password},
+                    **self._parser_kwargs(_HiredisParser),
                     **self.config.connection_kwargs
                 )
                 self._sync_client = self._sentinel.master_for(
@@ -191,10 +356,12 @@ class RedisConnector:
                     port=self.config.port,
                     db=self.config.db,
                     max_connections=self.config.max_connections,
+                    **self._parser_kwargs(_HiredisParser),
                     **self.config.connection_kwargs
                 )
                 self._sync_client = redis.Redis(connection_pool=self._connection_pool)
             
+            self._set_if_absent_script = self._sync_client.register_script(SET_IF_ABSENT_SCRIPT)
             logger.info(f"Sync Redis client created for {self.config.mode.value} mode")
             
         except Exception as e:
@@ -207,6 +374,7 @@ class RedisConnector:
                 self._async_client = aioredis.from_url(
                     self.config.redis_url,
                     max_connections=self.config.max_connections,
+                    **self._parser_kwargs(_AsyncHiredisParser),
                     **self.config.connection_kwargs
                 )
             elif self.config.mode == RedisMode.SENTINEL:
@@ -216,6 +384,7 @@ class RedisConnector:
                     port=self.config.port,
                     db=self.config.db,
                     max_connections=self.config.max_connections,
+                    **self._parser_kwargs(_AsyncHiredisParser),
                     **self.config.connection_kwargs
                 )
                 self._async_client = aioredis.Redis(connection_pool=self._async_connection_pool)
@@ -225,10 +394,12 @@ class RedisConnector:
                     port=self.config.port,
                     db=self.config.db,
                     max_connections=self.config.max_connections,
+                    **self._parser_kwargs(_AsyncHiredisParser),
                     **self.config.connection_kwargs
                 )
                 self._async_client = aioredis.Redis(connection_pool=self._async_connection_pool)
             
+            self._set_if_absent_script_async = self._async_client.register_script(SET_IF_ABSENT_SCRIPT)
             logger.info(f"Async Redis client created for {self.config.mode.value} mode")
             
         except Exception as e:
@@ -249,11 +420,11 @@ class RedisConnector:
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None, 
             format: Optional[SerializationFormat] = None) -> bool:
-        format = format or self.config.default_serialization
-        ttl = ttl or self.config.default_ttl
+        format = format or self._default_format
+        ttl = ttl or self._default_ttl
         
         try:
-            serialized_value = self.serializer.serialize(value, format)
+            serialized_value = self._serialize(value, format)
             with self.get_client() as client:
                 return client.set(key, serialized_value, ex=ttl)
         except Exception as e:
@@ -261,18 +432,64 @@ class RedisConnector:
             return False
     
     def get(self, key: str, format: Optional[SerializationFormat] = None) -> Any:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             with self.get_client() as client:
                 data = client.get(key)
                 if data is None:
                     return None
-                return self.serializer.deserialize(data, format)
+                return self._deserialize(data, format)
         except Exception as e:
             logger.error(f"Failed to get key {key}: {e}")
             return None
     
+    def set_if_absent(self, key: str, value: Any, ttl: Optional[int] = None,
+                      format: Optional[SerializationFormat] = None) -> Any:
+        """Atomically store value unless key exists; returns the existing value, or None if stored"""
+        format = format or self._default_format
+        ttl = ttl or self._default_ttl
+        
+        try:
+            serialized_value = self._serialize(value, format)
+            data = self._set_if_absent_script(keys=[key], args=[serialized_value, ttl or ''])
+            if data is None:
+                return None
+            return self._deserialize(data, format)
+        except Exception as e:
+            logger.error(f"Failed to set key {key} if absent: {e}")
+            return None
+    
+    def get_many(self, keys: List[str], format: Optional[SerializationFormat] = None) -> List[Any]:
+        """Fetch several keys in one MGET round-trip, None for missing keys"""
+        format = format or self._default_format
+        
+        try:
+            with self.get_client() as client:
+                data = client.mget(keys)
+            deserialize = self._deserialize
+            return [None if item is None else deserialize(item, format) for item in data]
+        except Exception as e:
+            logger.error(f"Failed to get keys {keys}: {e}")
+            return [None] * len(keys)
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None,
+                 format: Optional[SerializationFormat] = None) -> bool:
+        """Write several keys with a shared TTL through a single pipeline"""
+        format = format or self._default_format
+        ttl = ttl or self._default_ttl
+        
+        try:
+            serialize = self._serialize
+            with self.get_client() as client:
+                pipe = client.pipeline(transaction=False)
+                for key, value in mapping.items():
+                    pipe.set(key, serialize(value, format), ex=ttl)
+                return all(pipe.execute())
+        except Exception as e:
+            logger.error(f"Failed to set keys {list(mapping)}: {e}")
+            return False
+    
     def delete(self, *keys: str) -> int:
         try:
             with self.get_client() as client:
@@ -281,6 +498,15 @@ class RedisConnector:
             logger.error(f"Failed to delete keys {keys}: {e}")
             return 0
     
+    def unlink(self, *keys: str) -> int:
+        """Remove keys and reclaim their memory in the background (non-blocking DEL)"""
+        try:
+            with self.get_client() as client:
+                return client.unlink(*keys)
+        except Exception as e:
+            logger.error(f"Failed to unlink keys {keys}: {e}")
+            return 0
+    
     def exists(self, *keys: str) -> int:
         try:
             with self.get_client() as client:
@@ -307,12 +533,11 @@ class RedisConnector:
     
     def hset(self, name: str, mapping: Dict[str, Any], 
              format: Optional[SerializationFormat] = None) -> int:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
-            serialized_mapping = {}
-            for field, value in mapping.items():
-                serialized_mapping[field] = self.serializer.serialize(value, format)
+            serialize = self._serialize
+            serialized_mapping = {field: serialize(value, format) for field, value in mapping.items()}
             
             with self.get_client() as client:
                 return client.hset(name, mapping=serialized_mapping)
@@ -321,38 +546,56 @@ class RedisConnector:
             return 0
     
     def hget(self, name: str, key: str, format: Optional[SerializationFormat] = None) -> Any:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             with self.get_client() as client:
                 data = client.hget(name, key)
                 if data is None:
                     return None
-                return self.serializer.deserialize(data, format)
+                return self._deserialize(data, format)
         except Exception as e:
             logger.error(f"Failed to get hash field {name}:{key}: {e}")
             return None
     
     def hgetall(self, name: str, format: Optional[SerializationFormat] = None) -> Dict[str, Any]:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             with self.get_client() as client:
                 data = client.hgetall(name)
-                result = {}
-                for field, value in data.items():
-                    field_str = field.decode('utf-8') if isinstance(field, bytes) else field
-                    result[field_str] = self.serializer.deserialize(value, format)
-                return result
+            deserialize = self._deserialize
+            return {
+                (field if isinstance(field, str) else field.decode('utf-8')): deserialize(value, format)
+                for field, value in data.items()
+            }
         except Exception as e:
             logger.error(f"Failed to get all hash fields for {name}: {e}")
             return {}
     
+    def hmget_many(self, name: str, fields: List[str],
+                   format: Optional[SerializationFormat] = None) -> Dict[str, Any]:
+        """Fetch only the requested hash fields in a single HMGET"""
+        format = format or self._default_format
+        
+        try:
+            with self.get_client() as client:
+                data = client.hmget(name, fields)
+            deserialize = self._deserialize
+            return {
+                field: None if value is None else deserialize(value, format)
+                for field, value in zip(fields, data)
+            }
+        except Exception as e:
+            logger.error(f"Failed to get hash fields {fields} for {name}: {e}")
+            return {}
+    
     def lpush(self, name: str, *values: Any, format: Optional[SerializationFormat] = None) -> int:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
-            serialized_values = [self.serializer.serialize(v, format) for v in values]
+            serialize = self._serialize
+            serialized_values = [serialize(v, format) for v in values]
             with self.get_client() as client:
                 return client.lpush(name, *serialized_values)
         except Exception as e:
@@ -360,10 +603,11 @@ class RedisConnector:
             return 0
     
     def rpush(self, name: str, *values: Any, format: Optional[SerializationFormat] = None) -> int:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
-            serialized_values = [self.serializer.serialize(v, format) for v in values]
+            serialize = self._serialize
+            serialized_values = [serialize(v, format) for v in values]
             with self.get_client() as client:
                 return client.rpush(name, *serialized_values)
         except Exception as e:
@@ -372,21 +616,23 @@ class RedisConnector:
     
     def lrange(self, name: str, start: int, end: int, 
                format: Optional[SerializationFormat] = None) -> List[Any]:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             with self.get_client() as client:
                 data = client.lrange(name, start, end)
-                return [self.serializer.deserialize(item, format) for item in data]
+            deserialize = self._deserialize
+            return [deserialize(item, format) for item in data]
         except Exception as e:
             logger.error(f"Failed to get list range for {name}: {e}")
             return []
     
     def sadd(self, name: str, *values: Any, format: Optional[SerializationFormat] = None) -> int:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
-            serialized_values = [self.serializer.serialize(v, format) for v in values]
+            serialize = self._serialize
+            serialized_values = [serialize(v, format) for v in values]
             with self.get_client() as client:
                 return client.sadd(name, *serialized_values)
         except Exception as e:
@@ -394,12 +640,13 @@ class RedisConnector:
             return 0
     
     def smembers(self, name: str, format: Optional[SerializationFormat] = None) -> Set[Any]:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             with self.get_client() as client:
                 data = client.smembers(name)
-                return {self.serializer.deserialize(item, format) for item in data}
+            deserialize = self._deserialize
+            return {deserialize(item, format) for item in data}
         except Exception as e:
             logger.error(f"Failed to get set members for {name}: {e}")
             return set()
@@ -407,11 +654,11 @@ class RedisConnector:
 
     async def set_async(self, key: str, value: Any, ttl: Optional[int] = None,
                        format: Optional[SerializationFormat] = None) -> bool:
-        format = format or self.config.default_serialization
-        ttl = ttl or self.config.default_ttl
+        format = format or self._default_format
+        ttl = ttl or self._default_ttl
         
         try:
-            serialized_value = self.serializer.serialize(value, format)
+            serialized_value = self._serialize(value, format)
             async with self.get_async_client() as client:
                 return await client.set(key, serialized_value, ex=ttl)
         except Exception as e:
@@ -419,18 +666,33 @@ class RedisConnector:
             return False
     
     async def get_async(self, key: str, format: Optional[SerializationFormat] = None) -> Any:
-        format = format or self.config.default_serialization
+        format = format or self._default_format
         
         try:
             async with self.get_async_client() as client:
                 data = await client.get(key)
                 if data is None:
                     return None
-                return self.serializer.deserialize(data, format)
+                return self._deserialize(data, format)
         except Exception as e:
             logger.error(f"Failed to get key {key} async: {e}")
             return None
     
+    async def set_if_absent_async(self, key: str, value: Any, ttl: Optional[int] = None,
+                                  format: Optional[SerializationFormat] = None) -> Any:
+        format = format or self._default_format
+        ttl = ttl or self._default_ttl
+        
+        try:
+            serialized_value = self._serialize(value, format)
+            data = await self._set_if_absent_script_async(keys=[key], args=[serialized_value, ttl or ''])
+            if data is None:
+                return None
+            return self._deserialize(data, format)
+        except Exception as e:
+            logger.error(f"Failed to set key {key} if absent async: {e}")
+            return None
+    
     async def delete_async(self, *keys: str) -> int:
         try:
             async with self.get_async_client() as client:
@@ -484,6 +746,10 @@ class RedisConnector:
     
 
     def keys(self, pattern: str = "*") -> List[str]:
+        """Blocking O(N) KEYS; disabled unless REDIS_ALLOW_KEYS is set, prefer scan_iter"""
+        if not self.config.allow_keys:
+            raise RuntimeError("KEYS is disabled, use scan_iter() or set REDIS_ALLOW_KEYS=true")
+        
         try:
             with self.get_client() as client:
                 keys = client.keys(pattern)
@@ -513,7 +779,7 @@ class RedisConnector:
     
     async def close_async(self):
         if self._async_client:
-            await self._async_client.close()
+            await self._async_client.aclose()
         if self._async_connection_pool:
             await self._async_connection_pool.disconnect()
         logger.info("Async Redis connections closed")
@@ -1,7 +1,8 @@
 import asyncio
 import hashlib
-from dataclasses import dataclass
-from typing import Any, Callable, Optional,  TypeVar
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional,  TypeVar
 from infrastructure.cache.redis import RedisConnector
 
 
@@ -15,41 +16,64 @@ class CacheStats:
     sets: int = 0
     deletes: int = 0
     errors: int = 0
+    # An attribute += is a separate read and write, so threads (sync clients,
+    # run_in_executor) could lose updates; all mutation goes through this lock
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+    
+    def record(self, hits: int = 0, misses: int = 0, sets: int = 0, deletes: int = 0, errors: int = 0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.sets += sets
+            self.deletes += deletes
+            self.errors += errors
     
     @property
     def hit_rate(self) -> float:
-        total = self.hits + self.misses
-        return (self.hits / total * 100) if total > 0 else 0.0
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return (hits / total * 100) if total > 0 else 0.0
     
     def reset(self):
-        self.hits = self.misses = self.sets = self.deletes = self.errors = 0
+        with self._lock:
+            self.hits = self.misses = self.sets = self.deletes = self.errors = 0
 
 
 class RedisCache:    
     def __init__(self, connector: RedisConnector, prefix: str = "cache"):
         self.connector = connector
         self.prefix = prefix
+        self._key_prefix = prefix + ":"
+        self._key_prefix_bytes = self._key_prefix.encode()
         self.stats = CacheStats()
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     def _make_key(self, key: str) -> str:
-        return f"{self.prefix}:{key}"
+        return self._key_prefix + key
+    
+    def _make_key_bytes(self, key: str) -> bytes:
+        # redis-py passes bytes keys through without re-encoding them
+        return self._key_prefix_bytes + key.encode()
     
     def _hash_key(self, *args, **kwargs) -> str:
-        key_data = str(args) + str(sorted(kwargs.items()))
-        return hashlib.md5(key_data.encode()).hexdigest()
+        h = hashlib.blake2b(repr(args).encode(), digest_size=16)
+        h.update(b'|')
+        h.update(repr(sorted(kwargs.items())).encode())
+        return h.hexdigest()
     
     def get(self, key: str, default: Any = None) -> Any:
         try:
             cache_key = self._make_key(key)
             value = self.connector.get(cache_key)
             if value is not None:
-                self.stats.hits += 1
+                self.stats.record(hits=1)
                 return value
             else:
-                self.stats.misses += 1
+                self.stats.record(misses=1)
                 return default
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return default
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -57,10 +81,34 @@ class RedisCache:
             cache_key = self._make_key(key)
             result = self.connector.set(cache_key, value, ttl)
             if result:
-                self.stats.sets += 1
+                self.stats.record(sets=1)
+            return result
+        except Exception:
+            self.stats.record(errors=1)
+            return False
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        try:
+            make_key = self._make_key_bytes
+            values = self.connector.get_many([make_key(key) for key in keys])
+            found = {key: value for key, value in zip(keys, values) if value is not None}
+            self.stats.record(hits=len(found), misses=len(keys) - len(found))
+            return found
+        except Exception:
+            self.stats.record(errors=1)
+            return {}
+    
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        try:
+            make_key = self._make_key_bytes
+            result = self.connector.set_many(
+                {make_key(key): value for key, value in mapping.items()}, ttl
+            )
+            if result:
+                self.stats.record(sets=len(mapping))
             return result
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return False
     
     def delete(self, key: str) -> bool:
@@ -68,10 +116,10 @@ class RedisCache:
             cache_key = self._make_key(key)
             result = self.connector.delete(cache_key) > 0
             if result:
-                self.stats.deletes += 1
+                self.stats.record(deletes=1)
             return result
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return False
     
     def exists(self, key: str) -> bool:
@@ -79,28 +127,46 @@ class RedisCache:
             cache_key = self._make_key(key)
             return self.connector.exists(cache_key) > 0
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return False
     
     def clear_prefix(self, pattern: str = "*") -> int:
         try:
-            full_pattern = f"{self.prefix}:{pattern}"
+            full_pattern = self._key_prefix + pattern
             count = 0
-            for key in self.connector.scan_iter(match=full_pattern):
-                if self.connector.delete(key) > 0:
-                    count += 1
-            self.stats.deletes += count
+            batch = []
+            for key in self.connector.scan_iter(match=full_pattern, count=5000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    count += self.connector.unlink(*batch)
+                    batch.clear()
+            if batch:
+                count += self.connector.unlink(*batch)
+            self.stats.record(deletes=count)
             return count
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return 0
     
+    def set_if_absent(self, key: str, value: Any, ttl: Optional[int] = None) -> Any:
+        """Store value unless another writer got there first; returns the winning value"""
+        try:
+            cache_key = self._make_key(key)
+            existing = self.connector.set_if_absent(cache_key, value, ttl)
+            if existing is None:
+                self.stats.record(sets=1)
+                return value
+            return existing
+        except Exception:
+            self.stats.record(errors=1)
+            return value
+    
     def get_or_set(self, key: str, func: Callable[[], Any], ttl: Optional[int] = None) -> Any:
         value = self.get(key)
         if value is None:
             value = func()
             if value is not None:
-                self.set(key, value, ttl)
+                value = self.set_if_absent(key, value, ttl)
         return value
     
     async def get_async(self, key: str, default: Any = None) -> Any:
@@ -108,13 +174,13 @@ class RedisCache:
             cache_key = self._make_key(key)
             value = await self.connector.get_async(cache_key)
             if value is not None:
-                self.stats.hits += 1
+                self.stats.record(hits=1)
                 return value
             else:
-                self.stats.misses += 1
+                self.stats.record(misses=1)
                 return default
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return default
     
     async def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -122,19 +188,56 @@ class RedisCache:
             cache_key = self._make_key(key)
             result = await self.connector.set_async(cache_key, value, ttl)
             if result:
-                self.stats.sets += 1
+                self.stats.record(sets=1)
             return result
         except Exception:
-            self.stats.errors += 1
+            self.stats.record(errors=1)
             return False
     
+    async def set_if_absent_async(self, key: str, value: Any, ttl: Optional[int] = None) -> Any:
+        try:
+            cache_key = self._make_key(key)
+            existing = await self.connector.set_if_absent_async(cache_key, value, ttl)
+            if existing is None:
+                self.stats.record(sets=1)
+                return value
+            return existing
+        except Exception:
+            self.stats.record(errors=1)
+            return value
+    
     async def get_or_set_async(self, key: str, func: Callable[[], Any], ttl: Optional[int] = None) -> Any:
         value = await self.get_async(key)
-        if value is None:
+        if value is not None:
+            return value
+        
+        # Concurrent misses on the same key wait for the first caller's result
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Our own cancellation propagates; if only the leader was cancelled,
+                # loop and take over (or join whoever already has)
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
             if asyncio.iscoroutinefunction(func):
                 value = await func()
             else:
                 value = func()
             if value is not None:
-                await self.set_async(key, value, ttl)
-        return value
+                value = await self.set_if_absent_async(key, value, ttl)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure does not log a warning
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+            self._inflight.pop(key, None)
@@ -1,20 +1,26 @@
 import logging
+import time
 from contextlib import contextmanager, asynccontextmanager
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional,  AsyncGenerator, Generator
+from functools import cached_property
+from typing import Any, Dict, List, Mapping, Optional,  AsyncGenerator, Generator
 
 from pydantic import Field, field_validator
 from sqlalchemy import create_engine, text, MetaData, inspect
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine
 from pydantic_settings import BaseSettings
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Schema changes are rare; catalog queries for get_table_info are reused for this long
+_TABLE_INFO_TTL = 60.0
+
 
 class DatabaseBackend(str, Enum):
     """Supported database backends"""
@@ -42,6 +48,7 @@ class DatabaseConfig(BaseSettings):
     pool_timeout: int = Field(default=30, ge=1, description="Pool checkout timeout")
     pool_recycle: int = Field(default=3600, ge=300, description="Connection recycle time")
     pool_pre_ping: bool = Field(default=True, description="Enable connection health checks")
+    pool_use_lifo: bool = Field(default=True, description="Reuse the most recently returned connection first")
     
     # SSL and security
     ssl_mode: str = Field(default="prefer", description="SSL mode")
@@ -53,10 +60,23 @@ class DatabaseConfig(BaseSettings):
     query_timeout: int = Field(default=30, ge=1, description="Query timeout in seconds")
     echo_queries: bool = Field(default=False, description="Log SQL queries")
     
+    # psycopg3 server-side prepares a statement after this many executions
+    prepare_threshold: int = Field(default=5, ge=0, description="psycopg3 auto-prepare threshold")
+    
     # Async settings
     async_pool_size: int = Field(default=20, ge=1, description="Async pool size")
     async_max_overflow: int = Field(default=40, ge=0, description="Async max overflow")
     
+    # asyncpg keeps per-connection caches of prepared statements (server side and SQLAlchemy's)
+    statement_cache_size: int = Field(default=1024, ge=0, description="asyncpg prepared statement cache size")
+    prepared_statement_cache_size: int = Field(default=1024, ge=0, description="SQLAlchemy asyncpg statement cache size")
+    jit: bool = Field(default=False, description="Allow PostgreSQL JIT for async connections")
+    application_name: str = Field(default="shortener", description="Reported in pg_stat_activity")
+    
+    # Requests are served from the async engine; the sync one is opt-in for blocking tooling
+    sync_engine_enabled: bool = Field(default=False, description="Also build the sync engine")
+    driver: Optional[str] = Field(default=None, description="Override the sync DBAPI driver (e.g. psycopg2)")
+    
     # Custom connection parameters
     connection_args: Dict[str, Any] = Field(default_factory=dict, description="Additional connection arguments")
     
@@ -80,12 +100,12 @@ class DatabaseConfig(BaseSettings):
             return defaults.get(backend, v)
         return v
     
-    @property
+    @cached_property
     def sync_url(self) -> str:
         """Generate synchronous database URL"""
         return self._build_url(async_mode=False)
     
-    @property
+    @cached_property
     def async_url(self) -> str:
         """Generate asynchronous database URL"""
         return self._build_url(async_mode=True)
@@ -98,7 +118,7 @@ class DatabaseConfig(BaseSettings):
         
         drivers = {
             DatabaseBackend.POSTGRESQL: {
-                "sync": "postgresql+psycopg2",
+                "sync": "postgresql+psycopg",
                 "async": "postgresql+asyncpg"
             },
             DatabaseBackend.MYSQL: {
@@ -115,23 +135,66 @@ class DatabaseConfig(BaseSettings):
             }
         }
         
-        driver = drivers[self.backend]["async" if async_mode else "sync"]
+        if not async_mode and self.driver:
+            driver = f"{self.backend.value}+{self.driver}"
+        else:
+            driver = drivers[self.backend]["async" if async_mode else "sync"]
         auth = f"{self.username}:{self.password}@" if self.username else ""
         
         return f"{driver}://{auth}{self.host}:{self.port}/{self.database}"
 
 
+@dataclass(slots=True, frozen=True)
+class DatabaseRuntimeConfig:
+    """Frozen snapshot of a validated DatabaseConfig, read by engine setup and diagnostics"""
+    
+    backend: DatabaseBackend
+    host: str
+    port: int
+    database: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+    pool_use_lifo: bool
+    echo_queries: bool
+    prepare_threshold: int
+    async_pool_size: int
+    async_max_overflow: int
+    statement_cache_size: int
+    prepared_statement_cache_size: int
+    jit: bool
+    application_name: str
+    sync_engine_enabled: bool
+    driver: Optional[str]
+    connection_args: Dict[str, Any]
+    sync_url: str
+    async_url: str
+    
+    @classmethod
+    def from_settings(cls, config: DatabaseConfig) -> "DatabaseRuntimeConfig":
+        return cls(**{f.name: getattr(config, f.name) for f in fields(cls)})
+
+
 class DatabaseConnector:
     
     def __init__(self, config: DatabaseConfig):
-        self.config = config
+        self.config = DatabaseRuntimeConfig.from_settings(config)
         self._sync_engine: Optional[Engine] = None
         self._async_engine: Optional[AsyncEngine] = None
         self._sync_session_factory: Optional[sessionmaker] = None
-        self._async_session_factory: Optional[sessionmaker] = None
+        self._async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
         self._metadata = MetaData()
+        # Built once; health checks run it on every probe
+        self._heartbeat_sql = text("SELECT 1")
+        self._table_info: Optional[Dict[str, Any]] = None
+        self._table_info_expires_at = 0.0
         
-        self._setup_sync_engine()
+        # Requests are served from the async engine; the sync one is opt-in
+        # for tooling that still needs a blocking driver
+        if self.config.sync_engine_enabled:
+            self._setup_sync_engine()
         self._setup_async_engine()
     
     def _setup_sync_engine(self):
@@ -143,14 +206,20 @@ class DatabaseConnector:
                 "pool_timeout": self.config.pool_timeout,
                 "pool_recycle": self.config.pool_recycle,
                 "pool_pre_ping": self.config.pool_pre_ping,
+                "pool_use_lifo": self.config.pool_use_lifo,
                 "echo": self.config.echo_queries,
                 **self.config.connection_args
             }
             
+            if make_url(self.config.sync_url).drivername == "postgresql+psycopg":
+                engine_kwargs["connect_args"] = {
+                    "prepare_threshold": self.config.prepare_threshold,
+                    **engine_kwargs.get("connect_args", {})
+                }
+            
             self._sync_engine = create_engine(self.config.sync_url, **engine_kwargs)
             self._sync_session_factory = sessionmaker(
                 bind=self._sync_engine,
-                autocommit=False,
                 autoflush=False,
                 expire_on_commit=False
             )
@@ -173,16 +242,26 @@ class DatabaseConnector:
                 "pool_timeout": self.config.pool_timeout,
                 "pool_recycle": self.config.pool_recycle,
                 "pool_pre_ping": self.config.pool_pre_ping,
+                "pool_use_lifo": self.config.pool_use_lifo,
                 "echo": self.config.echo_queries,
                 **self.config.connection_args
             }
         
+        if make_url(self.config.async_url).drivername == "postgresql+asyncpg":
+            engine_kwargs["connect_args"] = {
+                "statement_cache_size": self.config.statement_cache_size,
+                "prepared_statement_cache_size": self.config.prepared_statement_cache_size,
+                "server_settings": {
+                    "jit": "on" if self.config.jit else "off",
+                    "application_name": self.config.application_name,
+                },
+                **engine_kwargs.get("connect_args", {})
+            }
+        
         try:
             self._async_engine = create_async_engine(self.config.async_url, **engine_kwargs)
-            self._async_session_factory = sessionmaker(
+            self._async_session_factory = async_sessionmaker(
                 bind=self._async_engine,
-                class_=AsyncSession,
-                autocommit=False,
                 autoflush=False,
                 expire_on_commit=False
             )
@@ -194,10 +273,11 @@ class DatabaseConnector:
     
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
-        if not self._sync_session_factory:
+        session_factory = self._sync_session_factory
+        if session_factory is None:
             raise RuntimeError("Sync engine not initialized")
         
-        session = self._sync_session_factory()
+        session = session_factory()
         try:
             yield session
             session.commit()
@@ -219,10 +299,11 @@ class DatabaseConnector:
 
     @asynccontextmanager
     async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
-        if not self._async_session_factory:
+        session_factory = self._async_session_factory
+        if session_factory is None:
             raise RuntimeError("Async engine not initialized")
         
-        session = self._async_session_factory()
+        session = session_factory()
         try:
             yield session
             await session.commit()
@@ -242,15 +323,16 @@ class DatabaseConnector:
             yield conn
     
 
-    def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+    def execute_query(self, query: str, params: Optional[Dict] = None) -> List[Mapping[str, Any]]:
+        # yield_per streams from a server-side cursor instead of buffering the whole result first
         with self.get_connection() as conn:
-            result = conn.execute(text(query), params or {})
-            return [dict(row._mapping) for row in result.fetchall()]
+            result = conn.execution_options(yield_per=1000).execute(text(query), params or {})
+            return list(result.mappings())
     
-    async def execute_async_query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+    async def execute_async_query(self, query: str, params: Optional[Dict] = None) -> List[Mapping[str, Any]]:
         async with self.get_async_connection() as conn:
             result = await conn.execute(text(query), params or {})
-            return [dict(row._mapping) for row in result.fetchall()]
+            return result.mappings().all()
     
     def execute_command(self, command: str, params: Optional[Dict] = None) -> int:
         with self.get_connection() as conn:
@@ -267,7 +349,7 @@ class DatabaseConnector:
     def test_connection(self) -> bool:
         try:
             with self.get_connection() as conn:
-                conn.execute(text("SELECT 1"))
+                conn.execute(self._heartbeat_sql)
             return True
         except Exception as e:
             logger.error(f"Connection test failed: {e}")
@@ -276,20 +358,25 @@ class DatabaseConnector:
     async def test_async_connection(self) -> bool:
         try:
             async with self.get_async_connection() as conn:
-                await conn.execute(text("SELECT 1"))
+                await conn.execute(self._heartbeat_sql)
             return True
         except Exception as e:
             logger.error(f"Async connection test failed: {e}")
             return False
     
     def get_table_info(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self._table_info is not None and now < self._table_info_expires_at:
+            return self._table_info
         try:
             inspector = inspect(self._sync_engine)
-            return {
+            self._table_info = {
                 "tables": inspector.get_table_names(),
                 "views": inspector.get_view_names(),
                 "schemas": inspector.get_schema_names() if hasattr(inspector, 'get_schema_names') else []
             }
+            self._table_info_expires_at = now + _TABLE_INFO_TTL
+            return self._table_info
         except Exception as e:
             logger.error(f"Failed to get table info: {e}")
             return {}
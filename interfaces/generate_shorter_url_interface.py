@@ -3,6 +3,7 @@ from pydantic import HttpUrl
 
 class IGenerateShorterUrl(ABC):
     
+    @staticmethod
     @abstractmethod
-    def generate(link: str | int) -> str:
-        raise NotImplemented("Method Generate Of Interface IGenerateShorterUrl Is Not Implemented")
+    def generate(link: int) -> str:
+        raise NotImplementedError("Method Generate Of Interface IGenerateShorterUrl Is Not Implemented")
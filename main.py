@@ -1,11 +1,15 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from configs import settings
 from infrastructure import Initilizer
 from infrastructure import DatabaseConnector
 from infrastructure.cache.redis import RedisConnector
 from apies.shortener.router import generator_router
 configurations = settings.Settings()
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -14,14 +18,22 @@ async def lifespan(app: FastAPI):
     print("Application startup complete: Connections bound to app.state")
     
     yield
-    app.state.db_connection.close()
-    app.state.redis_connection.close()
+    # Dispose both engines/pools explicitly; errors here are otherwise swallowed on shutdown
+    try:
+        await app.state.db_connection.close_all()
+    except Exception as e:
+        logger.error(f"Failed to close database connections: {e}")
+    try:
+        await app.state.redis_connection.close_all()
+    except Exception as e:
+        logger.error(f"Failed to close Redis connections: {e}")
 
 
 app = FastAPI(
     title=configurations.PROJECT_NAME,
     version=configurations.VERSION,
     description="FastAPI application with SQLAlchemy, Pydantic, and Redis",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -32,8 +44,9 @@ app.include_router(generator_router)
 async def health():
     db : DatabaseConnector = app.state.db_connection
     redis: RedisConnector = app.state.redis_connection
+    db_ok, redis_ok = await asyncio.gather(db.test_async_connection(), redis.ping_async())
     return {
-        "db": db.test_connection(),
-        "redis": redis.ping()
+        "db": db_ok,
+        "redis": redis_ok
     }
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Index, Integer
+from sqlalchemy import BigInteger, Column, Identity, String, Text, Index
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 from sqlalchemy.types import DateTime
@@ -9,8 +9,8 @@ Base = declarative_base()
 class UrlShorter(Base):
     __tablename__ = "url_shorters"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    original_url = Column(String(2048), index=True, nullable=False)
+    id = Column(BigInteger, Identity(always=False), primary_key=True)
+    original_url = Column(String(2048), nullable=False)
     shorted_url = Column(Text, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -18,4 +18,5 @@ class UrlShorter(Base):
 
     __table_args__ = (
         Index("ix_url_shorter_original_url", "original_url"),
+        Index("ux_shorted_url", "shorted_url", unique=True, postgresql_include=["original_url"]),
     )
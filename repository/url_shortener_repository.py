@@ -1,78 +1,154 @@
-from typing import Optional, List
-from sqlalchemy import select
+from typing import Callable, Iterable, Optional, List
+from sqlalchemy import bindparam, exists, insert, select, text, update
 from sqlalchemy.exc import IntegrityError
-from infrastructure.databases.postgres import DatabaseConnector
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.url_shortener import UrlShorter
 
+# Read statements are built once; each call only binds parameters, so
+# SQLAlchemy goes straight to its compiled-SQL cache.
+_STMT_BY_ID = select(UrlShorter).where(UrlShorter.id == bindparam("i"))
+_STMT_BY_SHORT = select(UrlShorter).where(UrlShorter.shorted_url == bindparam("s"))
+_STMT_ORIGINAL_BY_SHORT = select(UrlShorter.original_url).where(UrlShorter.shorted_url == bindparam("s"))
+_STMT_EXISTS_BY_SHORT = select(exists().where(UrlShorter.shorted_url == bindparam("s")))
+_STMT_BY_ORIGINAL = select(UrlShorter).where(UrlShorter.original_url == bindparam("o"))
+_STMT_ALL = select(UrlShorter).offset(bindparam("offset")).limit(bindparam("limit"))
+_STMT_NOOP = text("SELECT 1")
+
+
+async def bulk_insert_with_copy(session: AsyncSession, original_urls: Iterable[str]) -> int:
+    """Stream rows into url_shorters with COPY, one round-trip for the whole batch.
+
+    Runs on the session's connection so it joins the caller's transaction.
+    COPY cannot return generated ids; shorted_url is left for a later pass.
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    # SQLAlchemy's asyncpg adapter only opens its transaction on the first statement
+    # it executes; without one, COPY would autocommit and escape a later rollback
+    if not driver_connection.is_in_transaction():
+        await connection.execute(_STMT_NOOP)
+    status = await driver_connection.copy_records_to_table(
+        UrlShorter.__tablename__,
+        records=[(url,) for url in original_urls],
+        columns=["original_url"],
+    )
+    return int(status.split()[-1])
 
 
 class UrlShorterRepository:
-    def __init__(self, db_connector: DatabaseConnector):
-        self.db_connector = db_connector
+    def __init__(self, session: AsyncSession):
+        self.session = session
 
-    def create(self, original_url: str, shorted_url: Optional[str] = None) -> Optional[UrlShorter]:
+    async def create(self, original_url: str, shorted_url: Optional[str] = None) -> Optional[UrlShorter]:
         try:
-            with self.db_connector.get_session() as session:
-                url_shorter = UrlShorter(
-                    original_url=original_url,
-                    shorted_url=shorted_url
-                )
-                session.add(url_shorter)
-                session.commit()
-                return url_shorter
+            url_shorter = UrlShorter(
+                original_url=original_url,
+                shorted_url=shorted_url
+            )
+            self.session.add(url_shorter)
+            await self.session.flush()
+            return url_shorter
         except IntegrityError as e:
             raise ValueError(f"URL shorter already exists or constraint violation: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to create URL shorter: {e}")
     
-    def get_by_id(self, url_id: str) -> Optional[UrlShorter]:
+    async def create_with_shortcode(self, original_url: str, encode: Callable[[int], str]) -> UrlShorter:
+        """Insert a row and derive its short code from the generated id in the same transaction.
+
+        The INSERT is flushed to obtain the id; the shorted_url assignment is
+        written by the session's single commit, with no extra SELECT/refresh.
+        """
+        try:
+            url_shorter = UrlShorter(original_url=original_url)
+            self.session.add(url_shorter)
+            await self.session.flush()
+            url_shorter.shorted_url = encode(url_shorter.id)
+            return url_shorter
+        except IntegrityError as e:
+            raise ValueError(f"URL shorter already exists or constraint violation: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to create URL shorter: {e}")
+    
+    async def bulk_create(self, original_urls: List[str], encode: Callable[[int], str]) -> List[str]:
+        """Insert a batch and assign short codes with two statements instead of one per row.
+
+        The INSERT goes out as multi-row VALUES ... RETURNING id batches and the
+        codes are written with a single executemany UPDATE keyed by primary key.
+        """
+        if not original_urls:
+            return []
+        try:
+            result = await self.session.execute(
+                insert(UrlShorter).returning(UrlShorter.id, sort_by_parameter_order=True),
+                [{"original_url": url} for url in original_urls]
+            )
+            ids = result.scalars().all()
+            shorted_urls = [encode(url_id) for url_id in ids]
+            await self.session.execute(
+                update(UrlShorter),
+                [{"id": url_id, "shorted_url": shorted_url} for url_id, shorted_url in zip(ids, shorted_urls)]
+            )
+            return shorted_urls
+        except IntegrityError as e:
+            raise ValueError(f"URL shorter already exists or constraint violation: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Failed to bulk create URL shorters: {e}")
+    
+    async def get_by_id(self, url_id: str) -> Optional[UrlShorter]:
         try:
-            with self.db_connector.get_session() as session:
-                stmt = select(UrlShorter).where(UrlShorter.id == url_id)
-                return session.execute(stmt).scalar_one_or_none()
+            return (await self.session.execute(_STMT_BY_ID, {"i": url_id})).scalar_one_or_none()
         except Exception as e:
             raise RuntimeError(f"Failed to get URL shorter by ID: {e}")
     
-    def get_by_shorted_url(self, shorted_url: str) -> Optional[UrlShorter]:
+    async def get_by_shorted_url(self, shorted_url: str) -> Optional[UrlShorter]:
         try:
-            with self.db_connector.get_session() as session:
-                stmt = select(UrlShorter).where(UrlShorter.shorted_url == shorted_url)
-                return session.execute(stmt).scalar_one_or_none()
+            return (await self.session.execute(_STMT_BY_SHORT, {"s": shorted_url})).scalar_one_or_none()
         except Exception as e:
             raise RuntimeError(f"Failed to get URL shorter by shortened URL: {e}")
     
-    def get_by_original_url(self, original_url: str) -> List[UrlShorter]:
+    async def get_original_url_by_shorted_url(self, shorted_url: str) -> Optional[str]:
+        """Resolve a short code to its target without loading the ORM entity.
+
+        Selecting only original_url lets Postgres answer from ux_shorted_url,
+        which INCLUDEs that column, as an index-only scan.
+        """
         try:
-            with self.db_connector.get_session() as session:
-                stmt = select(UrlShorter).where(UrlShorter.original_url == original_url)
-                return session.execute(stmt).scalars().all()
+            return (await self.session.execute(_STMT_ORIGINAL_BY_SHORT, {"s": shorted_url})).scalar_one_or_none()
+        except Exception as e:
+            raise RuntimeError(f"Failed to get original URL by shortened URL: {e}")
+    
+    async def get_by_original_url(self, original_url: str) -> List[UrlShorter]:
+        try:
+            return (await self.session.execute(_STMT_BY_ORIGINAL, {"o": original_url})).scalars().all()
         except Exception as e:
             raise RuntimeError(f"Failed to get URL shorteners by original URL: {e}")
     
-    def get_all(self, limit: int = 100, offset: int = 0) -> List[UrlShorter]:
+    async def get_all(self, limit: int = 100, offset: int = 0) -> List[UrlShorter]:
         try:
-            with self.db_connector.get_session() as session:
-                stmt = select(UrlShorter).offset(offset).limit(limit)
-                return session.execute(stmt).scalars().all()
+            return (await self.session.execute(_STMT_ALL, {"offset": offset, "limit": limit})).scalars().all()
         except Exception as e:
             raise RuntimeError(f"Failed to get all URL shorteners: {e}")
 
-    def exists_by_shorted_url(self, shorted_url: str) -> bool:
-        return self.get_by_shorted_url(shorted_url) is not None
+    async def exists_by_shorted_url(self, shorted_url: str) -> bool:
+        try:
+            return bool((await self.session.execute(_STMT_EXISTS_BY_SHORT, {"s": shorted_url})).scalar())
+        except Exception as e:
+            raise RuntimeError(f"Failed to check URL shorter existence: {e}")
 
-    def update(self, url_id: str, **kwargs) -> Optional[UrlShorter]:
+    async def update(self, url_id: str, **kwargs) -> Optional[UrlShorter]:
         try:
-            with self.db_connector.get_session() as session:
-                url_shorter = session.get(UrlShorter, url_id)
-                if not url_shorter:
-                    return None
-                for field, value in kwargs.items():
-                    if hasattr(url_shorter, field):
-                        setattr(url_shorter, field, value)
-                
-                session.flush()
-                session.refresh(url_shorter)
-                return url_shorter
+            url_shorter = await self.session.get(UrlShorter, url_id)
+            if not url_shorter:
+                return None
+            for field, value in kwargs.items():
+                if hasattr(url_shorter, field):
+                    setattr(url_shorter, field, value)
+            
+            await self.session.flush()
+            await self.session.refresh(url_shorter)
+            return url_shorter
         except IntegrityError as e:
             raise ValueError(f"Update constraint violation: {e}")
         except Exception as e:
@@ -80,7 +156,7 @@ class UrlShorterRepository:
 
 
 # # Usage example
-# def example_usage():
+# async def example_usage():
 #     """Example of how to use the repository"""
 #     from your_database_module import create_database_connector
     
@@ -94,26 +170,27 @@ class UrlShorterRepository:
 #     )
     
 
-#     repo = UrlShorterRepository(db_connector)
+#     async with db_connector.get_async_session() as session:
+#         repo = UrlShorterRepository(session)
     
 #     try:
-#         url_shorter = repo.create(
+#         url_shorter = await repo.create(
 #             original_url="https://www.example.com/very/long/url",
 #             shorted_url="abc123"
 #         )
 #         print(f"Created: {url_shorter.id}")
         
 
-#         found = repo.get_by_shorted_url("abc123")
+#         found = await repo.get_by_shorted_url("abc123")
 #         if found:
 #             print(f"Original URL: {found.original_url}")
         
 
-#         updated = repo.update(url_shorter.id, original_url="https://updated.com")
+#         updated = await repo.update(url_shorter.id, original_url="https://updated.com")
 #         print(f"Updated: {updated.original_url}")
         
 
-#         all_urls = repo.get_all(limit=10, offset=0)
+#         all_urls = await repo.get_all(limit=10, offset=0)
 #         print(f"Total found: {len(all_urls)}")
         
 #     except Exception as e:
@@ -0,0 +1,21 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Native base62 encoder; url_shortener_generator_helper falls back to pure Python without it."""
+
+cdef const char* _ALPHABET = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+
+cpdef str encode_base62(unsigned long long num):
+    # 62**11 > 2**64, so 11 digits always suffice
+    cdef char buf[11]
+    cdef int i = 11
+    cdef unsigned long long q
+    if num == 0:
+        return "0"
+    while num:
+        # One division per digit; with a constant divisor the C compiler lowers it
+        # to a reciprocal multiply and shift, and the remainder costs a multiply-subtract
+        q = num // 62
+        i -= 1
+        buf[i] = _ALPHABET[num - q * 62]
+        num = q
+    return buf[i:11].decode('ascii')
@@ -3,6 +3,7 @@ from services.url_shortener.url_shortener_generator_helper import encode_base62
 
 
 class UrlShortenerGenerator(IGenerateShorterUrl):
-    
-    def generate(link: str | int) -> str:
+
+    @staticmethod
+    def generate(link: int) -> str:
         return encode_base62(link)
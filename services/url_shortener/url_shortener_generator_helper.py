@@ -6,8 +6,18 @@ BASE = len(BASE62_ALPHABET)
 def encode_base62(num: int) -> str:
     if num == 0:
         return BASE62_ALPHABET[0]
-    s = []
+    # % and // avoid divmod's tuple; one-char strings are cached, so prepending
+    # builds the result without a temporary list or a reversal
+    alphabet = BASE62_ALPHABET
+    s = ''
     while num > 0:
-        num, rem = divmod(num, BASE)
-        s.append(BASE62_ALPHABET[rem])
-    return ''.join(reversed(s))
+        s = alphabet[num % 62] + s
+        num //= 62
+    return s
+
+
+try:
+    # Native build of the same encoder for unsigned 64-bit ids (see setup.py)
+    from services.url_shortener._base62 import encode_base62  # noqa: F811
+except ImportError:
+    pass
@@ -1,6 +1,10 @@
+from typing import Optional
+
+import orjson
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from infrastructure.databases.postgres import DatabaseConnector
+from infrastructure.cache.redis import RedisConnector, SerializationFormat
 from models.url_shortener import UrlShorter
 from repository.url_shortener_repository import UrlShorterRepository
 
@@ -13,18 +17,52 @@ from typing import Type
 from interfaces.generate_shorter_url_interface import IGenerateShorterUrl
 
 
+# Values are the rendered {"url": ...} response body, served as-is on a hit
+_CACHE_KEY_PREFIX = "r:"
+_CACHE_TTL = 3600
+# Unknown codes are remembered briefly as an empty value so repeated misses skip the DB
+_NEGATIVE_CACHE_TTL = 60
+
+
 class UrlShortenerService:
-    def __init__(self, shortener_algorim: Type[IGenerateShorterUrl], db_connector: Type[DatabaseConnector]):
+    def __init__(self, shortener_algorim: Type[IGenerateShorterUrl], session: AsyncSession,
+                 redis_connector: RedisConnector):
         self.shortener = shortener_algorim
-        self.repository = UrlShorterRepository(db_connector)
+        self.session = session
+        self.repository = UrlShorterRepository(session)
+        self.cache = redis_connector
         
-    def generate_url_shortener(self, url: str | Type[BaseModel]) -> str:
-        url_shortener: UrlShorter = self.repository.create(url)
-        shorted_link: str | int = self.shortener.generate(url_shortener.id)
-        url_shortener = self.repository.update(url_id=url_shortener.id, shorted_url=shorted_link)
-
+    async def generate_url_shortener(self, url: str | Type[BaseModel]) -> str:
+        # INSERT and the shorted_url UPDATE share one transaction: one WAL flush per shortened URL.
+        # It is committed here rather than by get_async_session so the write-through below
+        # never caches a row that failed to commit; the dependency's commit is then a no-op
+        url_shortener: UrlShorter = await self.repository.create_with_shortcode(url, self.shortener.generate)
+        await self.session.commit()
+        await self.cache.set_async(
+            _CACHE_KEY_PREFIX + url_shortener.shorted_url, orjson.dumps({"url": url}), _CACHE_TTL,
+            SerializationFormat.BYTES
+        )
         return url_shortener.shorted_url
     
-    def get_real_link(self, url: str | Type[BaseModel]):
-        return self.repository.get_by_shorted_url(url)
+    async def get_real_link_body(self, url: str | Type[BaseModel]) -> Optional[bytes]:
+        """Return the JSON response body for a short code, or None if it is unknown.
 
+        Cache hits are returned exactly as Redis replied, with no decode/re-encode.
+        """
+        cache_key = _CACHE_KEY_PREFIX + url
+        cached = await self.cache.get_async(cache_key, SerializationFormat.BYTES)
+        if cached is not None:
+            return cached or None
+        
+        original_url = await self.repository.get_original_url_by_shorted_url(url)
+        if original_url is None:
+            # NX so a miss racing a fresh shorten never overwrites its positive entry;
+            # if one landed in between, serve it
+            existing = await self.cache.set_if_absent_async(
+                cache_key, b"", _NEGATIVE_CACHE_TTL, SerializationFormat.BYTES
+            )
+            return existing or None
+        
+        body = orjson.dumps({"url": original_url})
+        await self.cache.set_async(cache_key, body, _CACHE_TTL, SerializationFormat.BYTES)
+        return body
@@ -0,0 +1,12 @@
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+# Builds the optional native base62 encoder in place:
+#     python setup.py build_ext --inplace
+setup(
+    name="url-shortener-extensions",
+    ext_modules=cythonize(
+        [Extension("services.url_shortener._base62", ["services/url_shortener/_base62.pyx"])],
+        compiler_directives={"language_level": "3"},
+    ),
+)
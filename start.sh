@@ -3,4 +3,4 @@ set -e
 
 alembic upgrade head
 
-uvicorn main:app --host 0.0.0.0 --port 8000
+uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
@@ -1,13 +1,19 @@
+from typing import AsyncGenerator
 from fastapi import Depends
+from infrastructure.cache.redis import RedisConnector
 from infrastructure.databases.postgres import DatabaseConnector
 from services.url_shortener.url_shortener_generator import UrlShortenerGenerator
 from services.url_shortener.url_shorterner_service import UrlShortenerService
-from utils.get_connections import get_db_connector
+from utils.get_connections import get_db_connector, get_redis_connector
 
-def get_url_shortener_service(
-    db_connector: DatabaseConnector = Depends(get_db_connector)
-) -> UrlShortenerService:
-    return UrlShortenerService(
-        shortener_algorim=UrlShortenerGenerator,
-        db_connector=db_connector
-    )
+async def get_url_shortener_service(
+    db_connector: DatabaseConnector = Depends(get_db_connector),
+    redis_connector: RedisConnector = Depends(get_redis_connector)
+) -> AsyncGenerator[UrlShortenerService, None]:
+    # One session per request: every repository call shares it and it commits once on exit
+    async with db_connector.get_async_session() as session:
+        yield UrlShortenerService(
+            shortener_algorim=UrlShortenerGenerator,
+            session=session,
+            redis_connector=redis_connector
+        )